@@ -1,15 +1,155 @@
 """Core Research Agent implementation."""
 
-from typing import Any, List, Optional, Dict
+from typing import Any, Iterator, List, Optional, Dict
 from langchain.agents import create_react_agent, AgentExecutor
-from langchain_core.prompts import PromptTemplate
 from langchain_core.tools import Tool
 from agent.tools import TOOLS
-from agent.prompts import SYSTEM_PROMPT, TASK_PROMPT_TEMPLATE
-from agent.utils import ExecutionTracker, print_section, print_thinking, print_action, print_result
+from agent.prompts import REACT_PROMPT, SYSTEM_PROMPT
+from agent.ratelimit import TokenBucket, estimate_tokens
+from agent.retry import is_retryable, retry
+from agent.utils import ExecutionTracker, json_loads, print_section, print_thinking, print_action, print_result, set_verbose
+import asyncio
+import concurrent.futures
 import config
+import datetime
+import functools
+import os
+import socket
+import threading
 import time
 
+# API hosts per provider, used to pre-warm DNS on agent construction
+_PROVIDER_HOSTS = {
+    "openai": "api.openai.com",
+    "gemini": "generativelanguage.googleapis.com",
+}
+
+
+_llm_cache_configured = False
+
+# Shared pool for the sync batch fallback; created on first use so
+# importing this module never spins up threads.
+_thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def _get_thread_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=config.MAX_WORKERS
+        )
+    return _thread_pool
+
+
+# Every sync entry point bridges async work onto this one persistent
+# background loop instead of spinning up a throwaway loop per call.
+# Pooled httpx connections are bound to the loop they were opened on, so
+# per-call loops would leave the shared async client holding keep-alive
+# connections whose loop is already closed.
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_loop_lock = threading.Lock()
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(target=_async_loop.run_forever, daemon=True).start()
+    return _async_loop
+
+
+def _run_async(coro):
+    """Run a coroutine on the background loop and block for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_async_loop()).result()
+
+
+# Shared httpx clients handed to the OpenAI SDK so every agent reuses
+# one pooled HTTP/2 connection set (one TLS handshake per host) instead
+# of building its own pool per instance
+_http_client = None
+_http_async_client = None
+
+
+def _get_http_clients():
+    global _http_client, _http_async_client
+    if _http_client is None:
+        import atexit
+        import httpx
+
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        _http_client = httpx.Client(http2=True, timeout=60, limits=limits)
+        _http_async_client = httpx.AsyncClient(http2=True, timeout=60, limits=limits)
+        atexit.register(_http_client.close)
+
+        def _close_async() -> None:
+            try:
+                # Close on the background loop, where the pooled
+                # connections live
+                asyncio.run_coroutine_threadsafe(
+                    _http_async_client.aclose(), _get_async_loop()
+                ).result(timeout=5)
+            except Exception:
+                pass
+
+        atexit.register(_close_async)
+    return _http_client, _http_async_client
+
+
+# One bucket shared by every agent in the process, since provider limits
+# apply per API key, not per agent instance
+_RATE_BUCKET = TokenBucket(tpm=config.RATE_LIMIT_TPM, rpm=config.RATE_LIMIT_RPM)
+
+
+def _dispatch_cost(task: str, model: str) -> int:
+    """Estimated budget for one run: prompt tokens plus the output cap."""
+    return estimate_tokens(task, model) + config.LLM_MAX_TOKENS
+
+
+@functools.lru_cache(maxsize=8)
+def _create_gemini_prompt_cache(model: str):
+    """Pin the static prompt prefix in a Gemini server-side content cache.
+
+    Returns the cache handle, or None when the installed
+    google-generativeai SDK predates content caching or creation fails
+    (e.g. the prefix is below the model's minimum cacheable size);
+    callers then simply send the full prompt on every request.
+    """
+    try:
+        from google.generativeai import caching
+    except ImportError:
+        return None
+
+    try:
+        return caching.CachedContent.create(
+            model=model,
+            system_instruction=SYSTEM_PROMPT,
+            ttl=datetime.timedelta(hours=1)
+        )
+    except Exception:
+        return None
+
+
+def _configure_llm_cache() -> None:
+    """Install a process-wide SQLite cache for LLM completions.
+
+    Identical (prompt, model) completions are then served from disk in
+    microseconds instead of a full API round trip. Only called when
+    caching is enabled, since cached responses are only appropriate at
+    low sampling temperatures.
+    """
+    global _llm_cache_configured
+    if _llm_cache_configured:
+        return
+
+    from langchain_community.cache import SQLiteCache
+    from langchain_core.globals import set_llm_cache
+
+    set_llm_cache(SQLiteCache(
+        database_path=os.path.join(config.WORKSPACE_DIR, ".llm_cache.sqlite")
+    ))
+    _llm_cache_configured = True
+
 
 class ResearchAgent:
     """
@@ -33,11 +173,12 @@ class ResearchAgent:
         temperature: float = config.LLM_TEMPERATURE,
         max_iterations: int = config.MAX_ITERATIONS,
         verbose: bool = config.VERBOSE,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        use_llm_cache: bool = config.ENABLE_LLM_CACHE
     ):
         """
         Initialize the Research Agent.
-        
+
         Args:
             provider: LLM provider ("openai" or "gemini")
             model: The LLM model to use (auto-selected if None)
@@ -45,17 +186,26 @@ class ResearchAgent:
             max_iterations: Maximum number of agent iterations
             verbose: Whether to print detailed execution logs
             api_key: API key (uses env var if not provided)
+            use_llm_cache: Serve identical completions from a local
+                SQLite cache (only sensible at low temperature)
         """
         self.provider = provider.lower()
         self.temperature = temperature
         self.max_iterations = max_iterations
         self.verbose = verbose
+        # Progress echoes follow this agent's verbose flag (process-wide;
+        # the CLI only ever drives one agent at a time)
+        set_verbose(verbose)
         self.tracker = ExecutionTracker()
         
         # Validate provider
         if self.provider not in ["openai", "gemini"]:
             raise ValueError(f"Unknown provider: {provider}. Use 'openai' or 'gemini'")
-        
+
+        # Optionally cache completions on disk (process-wide)
+        if use_llm_cache:
+            _configure_llm_cache()
+
         # Initialize LLM based on provider
         self.llm = self._initialize_llm(provider, model, api_key)
         self.model = model or self._get_default_model(provider)
@@ -67,24 +217,47 @@ class ResearchAgent:
         self.agent = None
         self.executor = None
         self._setup_agent()
-    
+
+        # Warm up DNS in the background so the first run() does not pay
+        # the resolution cost on top of the TLS handshake
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self) -> None:
+        """Resolve the provider's API host ahead of the first request."""
+        try:
+            socket.getaddrinfo(_PROVIDER_HOSTS[self.provider], 443)
+        except OSError:
+            pass  # Offline or resolution failure; the first run will retry
+
     def _initialize_llm(self, provider: str, model: Optional[str], api_key: Optional[str]):
         """Initialize the LLM based on provider."""
         if provider == "openai":
             from langchain_openai import ChatOpenAI
+            http_client, http_async_client = _get_http_clients()
             return ChatOpenAI(
                 model=model or "gpt-4-turbo-preview",
                 temperature=self.temperature,
-                api_key=api_key or config.OPENAI_API_KEY
+                api_key=api_key or config.OPENAI_API_KEY,
+                streaming=True,
+                http_client=http_client,
+                http_async_client=http_async_client
             )
         elif provider == "gemini":
             from langchain_google_genai import ChatGoogleGenerativeAI
-            return ChatGoogleGenerativeAI(
-                model=model or "gemini-pro",
-                temperature=self.temperature,
-                google_api_key=api_key or config.GEMINI_API_KEY,
-                convert_system_message_to_human=True
-            )
+            kwargs = {
+                "model": model or "gemini-pro",
+                "temperature": self.temperature,
+                "google_api_key": api_key or config.GEMINI_API_KEY,
+                "convert_system_message_to_human": True,
+            }
+            # When both the SDK and the LangChain binding support content
+            # caching, reuse the static prompt prefix server-side so each
+            # call skips its prefill instead of re-sending it
+            if "cached_content" in getattr(ChatGoogleGenerativeAI, "__fields__", {}):
+                cached = _create_gemini_prompt_cache(kwargs["model"])
+                if cached is not None:
+                    kwargs["cached_content"] = cached.name
+            return ChatGoogleGenerativeAI(**kwargs)
         else:
             raise ValueError(f"Unknown provider: {provider}")
     
@@ -106,9 +279,7 @@ class ResearchAgent:
         self.agent = create_react_agent(
             llm=self.llm,
             tools=self.tools,
-            prompt=PromptTemplate.from_template(
-                SYSTEM_PROMPT + "\n\n" + TASK_PROMPT_TEMPLATE
-            )
+            prompt=REACT_PROMPT
         )
         
         # Create the executor
@@ -149,11 +320,19 @@ class ResearchAgent:
             # Run the agent
             if self.verbose:
                 print_thinking("Analyzing task and planning approach...")
-            
+
+            # Wait for rate-limit headroom before dispatching
+            _RATE_BUCKET.acquire_sync(_dispatch_cost(task, self.model))
+
+            # Transient 429/5xx failures are retried here, before the
+            # catch-all below converts anything into an error result; a
+            # server-mandated cooldown also penalizes the shared bucket
             start_time = time.time()
-            result = self.executor.invoke(agent_input)
+            result = retry(
+                self.executor.invoke, on_cooldown=_RATE_BUCKET.penalize
+            )(agent_input)
             execution_time = time.time() - start_time
-            
+
             self.tracker.iterations = 1  # Simplified tracking
             
             if self.verbose:
@@ -183,25 +362,374 @@ class ResearchAgent:
                 "error": str(e)
             }
     
+    async def _astream_answer(self, task: str):
+        """Yield the final answer token by token as the model emits it.
+
+        Model tokens stream for every planning step; only the text after
+        the ReAct "Final Answer:" marker is the user-facing answer, so
+        each model call is buffered until the marker appears and streamed
+        from there on. Tool-calling steps never contain the marker and
+        yield nothing.
+        """
+        marker = "Final Answer:"
+
+        # Streaming dispatches straight to the executor, so the shared
+        # rate budget applies here just as in run() and arun()
+        await _RATE_BUCKET.acquire(_dispatch_cost(task, self.model))
+
+        agent_input = {
+            "input": task,
+            "intermediate_steps": []
+        }
+
+        attempt = 0
+        while True:
+            buffer = ""
+            emitting = False
+            yielded = False
+            try:
+                async for event in self.executor.astream_events(agent_input, version="v1"):
+                    kind = event["event"]
+                    if kind == "on_chat_model_start":
+                        buffer = ""
+                        emitting = False
+                    elif kind == "on_chat_model_stream":
+                        text = event["data"]["chunk"].content
+                        if isinstance(text, list):
+                            text = "".join(part for part in text if isinstance(part, str))
+                        if not text:
+                            continue
+                        if emitting:
+                            yielded = True
+                            yield text
+                            continue
+                        buffer += text
+                        index = buffer.find(marker)
+                        if index != -1:
+                            emitting = True
+                            rest = buffer[index + len(marker):].lstrip()
+                            if rest:
+                                yielded = True
+                                yield rest
+                return
+            except Exception as e:
+                # Restart on transient failures, but only while nothing
+                # has been yielded yet — a retry after that would repeat
+                # answer tokens the caller already printed
+                if yielded or attempt >= 3 or not is_retryable(e):
+                    raise
+                attempt += 1
+                await asyncio.sleep(0.1 * (2 ** attempt))
+
+    def run_stream(self, task: str) -> Iterator[str]:
+        """
+        Run the agent on a task, yielding the final answer token by token.
+
+        Tokens arrive as the model generates them, so callers see the
+        first output at first-token latency instead of waiting for the
+        whole response.
+
+        Args:
+            task: The task description
+
+        Yields:
+            Pieces of the agent's final answer text
+        """
+        # Bridge the async event stream into a plain iterator for sync
+        # callers like the interactive prompt; running it on the shared
+        # background loop keeps pooled connections valid across calls
+        loop = _get_async_loop()
+        stream = self._astream_answer(task)
+        try:
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(
+                        stream.__anext__(), loop
+                    ).result()
+                except StopAsyncIteration:
+                    break
+        finally:
+            asyncio.run_coroutine_threadsafe(stream.aclose(), loop).result()
+
+    async def arun(self, task: str) -> Dict[str, Any]:
+        """
+        Run the agent on a given task asynchronously.
+
+        Uses AgentExecutor.ainvoke so multiple tasks can overlap their
+        LLM round-trips instead of waiting on each other.
+
+        Args:
+            task: The task description
+
+        Returns:
+            The same result dictionary as run()
+        """
+        try:
+            agent_input = {
+                "input": task,
+                "intermediate_steps": []
+            }
+
+            # Wait for rate-limit headroom before dispatching
+            await _RATE_BUCKET.acquire(_dispatch_cost(task, self.model))
+
+            start_time = time.time()
+            result = await retry(
+                self.executor.ainvoke, on_cooldown=_RATE_BUCKET.penalize
+            )(agent_input)
+            execution_time = time.time() - start_time
+
+            return {
+                "output": result.get('output', ''),
+                "metrics": {
+                    "execution_time": round(execution_time, 2),
+                    "provider": self.provider,
+                    "model": self.model,
+                    "success": True
+                },
+                "success": True
+            }
+
+        except Exception as e:
+            return {
+                "output": f"Error: {str(e)}",
+                "metrics": {},
+                "success": False,
+                "error": str(e)
+            }
+
+    async def arun_batch(
+        self,
+        tasks: List[str],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the agent on multiple tasks concurrently.
+
+        Tasks are independent and network-bound, so running them under
+        asyncio.gather cuts wall time to roughly the slowest task instead
+        of the sum of all tasks. A semaphore bounds in-flight requests to
+        stay under provider rate limits.
+
+        Args:
+            tasks: List of task descriptions
+            concurrency: Maximum number of tasks in flight at once
+                (defaults to the MAX_CONCURRENCY config setting)
+
+        Returns:
+            List of results for each task, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency or config.MAX_CONCURRENCY)
+
+        async def bounded_run(i: int, task: str) -> Dict[str, Any]:
+            async with semaphore:
+                if self.verbose:
+                    print(f"\n[Task {i}/{len(tasks)}] {task}")
+                return await self.arun(task)
+
+        results = await asyncio.gather(
+            *(bounded_run(i, task) for i, task in enumerate(tasks, 1)),
+            return_exceptions=True
+        )
+
+        # Normalize any stray exceptions into the standard result shape
+        return [
+            result if not isinstance(result, BaseException) else {
+                "output": f"Error: {str(result)}",
+                "metrics": {},
+                "success": False,
+                "error": str(result)
+            }
+            for result in results
+        ]
+
     def run_batch(self, tasks: List[str]) -> List[Dict[str, Any]]:
         """
         Run the agent on multiple tasks.
-        
+
         Args:
             tasks: List of task descriptions
-            
+
         Returns:
             List of results for each task
         """
-        results = []
-        for i, task in enumerate(tasks, 1):
-            if self.verbose:
-                print(f"\n[Task {i}/{len(tasks)}] {task}")
-            result = self.run(task)
-            results.append(result)
-        
-        return results
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _run_async(self.arun_batch(tasks))
+
+        # Called from inside a running event loop, where asyncio.run is
+        # unavailable. Fan out on a shared thread pool instead; blocking
+        # LLM and tool I/O releases the GIL, so threads still overlap.
+        return list(_get_thread_pool().map(self.run, tasks))
     
+    def run_multi(self, tasks: List[str]) -> List[Dict[str, Any]]:
+        """
+        Answer several independent tasks with a single LLM call.
+
+        Packing N prompts into one request pays the round trip and the
+        prompt prefill once instead of N times. The model is asked for a
+        JSON array of {output, success} objects that is parsed back into
+        the standard per-task result shape. This path goes straight to
+        the LLM (no tool use), so it suits pure-knowledge tasks; batches
+        larger than MAX_BATCH_TASKS are chunked to limit the output
+        degradation that very large packs invite.
+
+        Args:
+            tasks: List of task descriptions
+
+        Returns:
+            List of results for each task, in input order
+        """
+        if not tasks:
+            return []
+
+        if len(tasks) > config.MAX_BATCH_TASKS:
+            results = []
+            for i in range(0, len(tasks), config.MAX_BATCH_TASKS):
+                results.extend(self.run_multi(tasks[i:i + config.MAX_BATCH_TASKS]))
+            return results
+
+        numbered = "\n".join(f"{i}. {task}" for i, task in enumerate(tasks, 1))
+        prompt = (
+            f"Answer each of the following {len(tasks)} tasks independently. "
+            f"Return only a JSON array of {len(tasks)} objects, one per task "
+            'in order, each shaped {"output": "<answer>", "success": true}.'
+            f"\n\n{numbered}"
+        )
+
+        _RATE_BUCKET.acquire_sync(_dispatch_cost(prompt, self.model))
+
+        start_time = time.time()
+        try:
+            response = retry(
+                self.llm.invoke, on_cooldown=_RATE_BUCKET.penalize
+            )(prompt)
+        except Exception as e:
+            return [{
+                "output": f"Error: {str(e)}",
+                "metrics": {},
+                "success": False,
+                "error": str(e)
+            } for _ in tasks]
+        execution_time = time.time() - start_time
+
+        text = getattr(response, "content", str(response))
+        try:
+            items = json_loads(text[text.index('['):text.rindex(']') + 1])
+        except ValueError:
+            items = None
+
+        if (
+            not isinstance(items, list)
+            or len(items) != len(tasks)
+            or not all(isinstance(item, dict) for item in items)
+        ):
+            # Unusable packed response (wrong shape, wrong length, or
+            # bare strings instead of objects); fall back to one run
+            # per task
+            return self.run_batch(tasks)
+
+        per_task_time = round(execution_time / len(tasks), 2)
+        return [{
+            "output": str(item.get("output", "")),
+            "metrics": {
+                "execution_time": per_task_time,
+                "provider": self.provider,
+                "model": self.model,
+                "success": bool(item.get("success", True))
+            },
+            "success": bool(item.get("success", True))
+        } for item in items]
+
+    async def arun_on_providers(
+        self,
+        task: str,
+        providers: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run one task on several providers concurrently.
+
+        The tool list and ReAct prompt are shared; only the LLM client
+        differs per provider, and the runs overlap under asyncio.gather
+        so comparing two providers costs roughly one run's latency.
+
+        Args:
+            task: The task description
+            providers: Provider names to run the task on
+
+        Returns:
+            Mapping of provider name to its result dictionary
+        """
+        providers = providers or ["openai", "gemini"]
+
+        def executor_for(name: str):
+            if name == self.provider:
+                return self.executor
+            llm = self._initialize_llm(name, None, None)
+            agent = create_react_agent(
+                llm=llm,
+                tools=self.tools,
+                prompt=REACT_PROMPT
+            )
+            return AgentExecutor.from_agent_and_tools(
+                agent=agent,
+                tools=self.tools,
+                max_iterations=self.max_iterations,
+                verbose=self.verbose,
+                handle_parsing_errors=True,
+                early_stopping_method="generate"
+            )
+
+        async def run_one(name: str) -> tuple:
+            start_time = time.time()
+            try:
+                # Built inside the handler so one provider's missing API
+                # key fails only that provider's entry, not the whole call
+                executor = executor_for(name)
+                result = await executor.ainvoke({
+                    "input": task,
+                    "intermediate_steps": []
+                })
+                execution_time = time.time() - start_time
+                return name, {
+                    "output": result.get('output', ''),
+                    "metrics": {
+                        "execution_time": round(execution_time, 2),
+                        "provider": name,
+                        "model": self._get_default_model(name),
+                        "success": True
+                    },
+                    "success": True
+                }
+            except Exception as e:
+                return name, {
+                    "output": f"Error: {str(e)}",
+                    "metrics": {},
+                    "success": False,
+                    "error": str(e)
+                }
+
+        results = await asyncio.gather(*(run_one(name) for name in providers))
+        return dict(results)
+
+    def run_on_many_providers(
+        self,
+        task: str,
+        providers: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run one task on several providers and collect their results.
+
+        Args:
+            task: The task description
+            providers: Provider names to run the task on
+
+        Returns:
+            Mapping of provider name to its result dictionary
+        """
+        return _run_async(self.arun_on_providers(task, providers))
+
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the agent."""
         return {
@@ -214,6 +742,28 @@ class ResearchAgent:
         }
 
 
+@functools.lru_cache(maxsize=16)
+def _build_agent(
+    provider: str,
+    model: Optional[str],
+    temperature: float,
+    max_iterations: int,
+    verbose: bool,
+    api_key: Optional[str],
+    use_llm_cache: bool
+) -> ResearchAgent:
+    """Build (or return a cached) ResearchAgent for the given settings."""
+    return ResearchAgent(
+        provider=provider,
+        model=model,
+        temperature=temperature,
+        max_iterations=max_iterations,
+        verbose=verbose,
+        api_key=api_key,
+        use_llm_cache=use_llm_cache
+    )
+
+
 def create_agent(
     provider: str = config.LLM_PROVIDER,
     model: Optional[str] = None,
@@ -222,14 +772,32 @@ def create_agent(
 ) -> ResearchAgent:
     """
     Factory function to create a Research Agent.
-    
+
+    Agents are memoized on their settings, so repeated calls with the
+    same arguments reuse the existing LLM client and executor instead of
+    rebuilding them.
+
     Args:
         provider: LLM provider ("openai" or "gemini")
         model: Specific model to use
         verbose: Whether to print detailed logs
         **kwargs: Additional arguments to pass to ResearchAgent
-        
+
     Returns:
         A configured ResearchAgent instance
     """
-    return ResearchAgent(provider=provider, model=model, verbose=verbose, **kwargs)
+    unexpected = set(kwargs) - {"temperature", "max_iterations", "api_key", "use_llm_cache"}
+    if unexpected:
+        raise TypeError(
+            f"create_agent() got unexpected keyword arguments: {sorted(unexpected)}"
+        )
+
+    return _build_agent(
+        provider=provider,
+        model=model,
+        temperature=kwargs.get("temperature", config.LLM_TEMPERATURE),
+        max_iterations=kwargs.get("max_iterations", config.MAX_ITERATIONS),
+        verbose=verbose,
+        api_key=kwargs.get("api_key"),
+        use_llm_cache=kwargs.get("use_llm_cache", config.ENABLE_LLM_CACHE)
+    )
@@ -0,0 +1,47 @@
+"""Shared async HTTP clients for agent tools.
+
+Pooled httpx connections are bound to the event loop they were opened
+on, so a single process-wide client breaks as soon as callers span more
+than one loop (a keep-alive connection checked out under a closed loop
+fails). One client per running loop keeps the pooling win — concurrent
+ReAct branches on the same loop share HTTP/2 connections and pay TLS
+handshakes once — without ever handing a connection across loops.
+"""
+
+import asyncio
+import atexit
+from typing import Dict
+
+import httpx
+
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the pooled AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(http2=True, timeout=_TIMEOUT, limits=_LIMITS)
+        _clients[loop] = client
+    return client
+
+
+def _close_clients():
+    """Close any clients whose loops are still alive at interpreter exit."""
+    for loop, client in list(_clients.items()):
+        if loop.is_closed():
+            continue
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+            else:
+                loop.run_until_complete(client.aclose())
+        except Exception:
+            pass
+
+
+atexit.register(_close_clients)
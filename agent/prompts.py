@@ -1,4 +1,14 @@
-"""Prompts and templates for the Research Agent."""
+"""Prompts and templates for the Research Agent.
+
+The system prompt and tool descriptions form the stable prefix of every
+request. Providers cache prompt prefixes server-side (OpenAI does so
+automatically for identical prefixes; Gemini via explicit content
+caches), so keep everything volatile — the task, the scratchpad — after
+this block and keep tool ordering deterministic, or every call pays
+full prefill again.
+"""
+
+from langchain_core.prompts import PromptTemplate
 
 SYSTEM_PROMPT = """You are an expert Research Agent with access to multiple tools. Your role is to:
 
@@ -40,3 +50,9 @@ REFLECTION_PROMPT = """Review your work:
 - Is there any missing information?
 
 If the task is complete, provide your final answer. Otherwise, explain what additional steps are needed."""
+
+# The combined ReAct prompt is fully static, so it is parsed exactly once
+# at import time and shared by every agent instance.
+REACT_PROMPT = PromptTemplate.from_template(
+    SYSTEM_PROMPT + "\n\n" + TASK_PROMPT_TEMPLATE
+)
@@ -0,0 +1,106 @@
+"""Cost-aware rate limiting for LLM dispatches.
+
+Providers enforce both request-per-minute and token-per-minute budgets;
+exceeding either returns a 429 that wastes a round trip and triggers
+backoff. The TokenBucket debits an estimated cost before each dispatch
+and sleeps until the budget refills, so calls queue locally instead of
+bouncing off the server.
+"""
+
+import asyncio
+import threading
+import time
+
+# tiktoken gives exact counts for OpenAI models; without it a chars/4
+# heuristic is close enough for budgeting purposes
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+def estimate_tokens(text: str, model: str = "gpt-4") -> int:
+    """Estimate how many tokens text will occupy for the given model."""
+    if tiktoken is not None:
+        try:
+            return len(tiktoken.encoding_for_model(model).encode(text))
+        except KeyError:
+            pass  # Unknown model (e.g. Gemini); fall through to heuristic
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """Combined token-per-minute and request-per-minute budget.
+
+    Both budgets refill continuously at their per-minute rates. acquire
+    blocks until the requested cost and one request slot are available,
+    then debits them atomically.
+    """
+
+    def __init__(self, tpm: int = 30000, rpm: int = 500):
+        """
+        Initialize the bucket.
+
+        Args:
+            tpm: Token budget per minute
+            rpm: Request budget per minute
+        """
+        self.tpm = tpm
+        self.rpm = rpm
+        self._tokens = float(tpm)
+        self._requests = float(rpm)
+        self._updated = time.monotonic()
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(float(self.tpm), self._tokens + self.tpm * elapsed / 60.0)
+        self._requests = min(float(self.rpm), self._requests + self.rpm * elapsed / 60.0)
+
+    def _try_acquire(self, cost_units: int) -> float:
+        """Debit the budget, or return the seconds to wait before retrying."""
+        # A cost above bucket capacity could never be satisfied (refill
+        # caps at tpm), so clamp it rather than wait forever; the server
+        # is the final arbiter for genuinely oversized requests anyway
+        cost_units = min(cost_units, self.tpm)
+        with self._lock:
+            self._refill()
+            wait = max(0.0, self._penalty_until - time.monotonic())
+            if self._tokens < cost_units:
+                wait = max(wait, (cost_units - self._tokens) * 60.0 / self.tpm)
+            if self._requests < 1:
+                wait = max(wait, (1 - self._requests) * 60.0 / self.rpm)
+            if wait <= 0:
+                self._tokens -= cost_units
+                self._requests -= 1
+            return wait
+
+    async def acquire(self, cost_units: int) -> None:
+        """Async-block until cost_units tokens and a request slot are free."""
+        while True:
+            wait = self._try_acquire(cost_units)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, cost_units: int) -> None:
+        """Blocking counterpart of acquire for sync call paths."""
+        while True:
+            wait = self._try_acquire(cost_units)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """Hold off all dispatches for a server-mandated cooldown.
+
+        Called with the Retry-After value when a 429 slips through
+        despite local budgeting.
+        """
+        with self._lock:
+            self._penalty_until = max(
+                self._penalty_until, time.monotonic() + seconds
+            )
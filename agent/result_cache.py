@@ -0,0 +1,125 @@
+"""Exact-match result cache for whole agent runs.
+
+Repeated identical tasks (batch re-runs, scripted invocations) otherwise
+pay a full LLM round trip each time. When sampling is deterministic
+(temperature == 0) the answer for an identical task is reusable, so runs
+are cached on disk keyed by provider, model, temperature, and task.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import diskcache
+
+# Key serialization runs twice per cached call (lookup + store); orjson
+# sorts and serializes straight to bytes, skipping the str round trip.
+try:
+    import orjson
+
+    def _dumps_key(payload: Any) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+except ImportError:
+    def _dumps_key(payload: Any) -> bytes:
+        return json.dumps(payload, sort_keys=True).encode()
+
+# blake3 hashes several times faster than sha256 (SIMD dispatch at
+# import); sha256 stays as the fallback when it is not installed.
+try:
+    from blake3 import blake3 as _hash_key
+except ImportError:
+    _hash_key = hashlib.sha256
+
+_CACHE_DIR = os.path.expanduser("~/.cache/research_agent")
+_DEFAULT_TTL = 3600
+
+
+class CachedAgent:
+    """Wrap a ResearchAgent with an exact-match run cache.
+
+    Non-deterministic agents (temperature > 0) bypass the cache
+    entirely; for them every run goes straight to the wrapped agent.
+    Attribute access falls through to the wrapped agent, so a
+    CachedAgent can be used anywhere a ResearchAgent is expected.
+    """
+
+    def __init__(self, agent, cache_dir: str = _CACHE_DIR, ttl: int = _DEFAULT_TTL):
+        """
+        Initialize the cached wrapper.
+
+        Args:
+            agent: The ResearchAgent to wrap
+            cache_dir: Directory for the on-disk cache
+            ttl: Seconds before a cached run expires
+        """
+        self.agent = agent
+        self.cache = diskcache.Cache(cache_dir)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(self, task: str) -> Optional[str]:
+        """Build the cache key for a task, or None when caching is unsafe."""
+        if self.agent.temperature > 0:
+            return None
+        payload = {
+            "provider": self.agent.provider,
+            "model": self.agent.model,
+            "temperature": self.agent.temperature,
+            "task": task,
+        }
+        return _hash_key(_dumps_key(payload)).hexdigest()
+
+    def _annotate(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add cache hit/miss counters to a result's metrics."""
+        metrics = dict(result.get("metrics") or {})
+        metrics["cache_hits"] = self.hits
+        metrics["cache_misses"] = self.misses
+        result = dict(result)
+        result["metrics"] = metrics
+        return result
+
+    def run(self, task: str) -> Dict[str, Any]:
+        """Run a task, serving an identical prior run from disk if possible."""
+        key = self.cache_key(task)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                return self._annotate(cached)
+
+        self.misses += 1
+        result = self.agent.run(task)
+        if key is not None and result.get("success"):
+            self.cache.set(key, result, expire=self.ttl)
+        return self._annotate(result)
+
+    def run_batch(self, tasks: List[str]) -> List[Dict[str, Any]]:
+        """Run a batch, dispatching only cache misses to the wrapped agent."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        miss_indices = []
+
+        for i, task in enumerate(tasks):
+            key = self.cache_key(task)
+            cached = self.cache.get(key) if key is not None else None
+            if cached is not None:
+                self.hits += 1
+                results[i] = self._annotate(cached)
+            else:
+                self.misses += 1
+                miss_indices.append(i)
+
+        if miss_indices:
+            fresh = self.agent.run_batch([tasks[i] for i in miss_indices])
+            for i, result in zip(miss_indices, fresh):
+                key = self.cache_key(tasks[i])
+                if key is not None and result.get("success"):
+                    self.cache.set(key, result, expire=self.ttl)
+                results[i] = self._annotate(result)
+
+        return results
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.agent, name)
@@ -0,0 +1,112 @@
+"""Retry middleware for transient LLM/API failures.
+
+A single 429 or 5xx from the provider would otherwise kill a whole run.
+Retrying with exponential backoff plus jitter turns that infrastructure
+noise into sub-second extra latency, while genuine client errors (bad
+auth, malformed requests) still fail immediately.
+"""
+
+import asyncio
+import functools
+import random
+import time
+from typing import Optional
+
+# Exception class names considered transient when no HTTP status is
+# attached (covers the OpenAI, Google, requests, and httpx families
+# without importing any of them)
+_RETRYABLE_NAMES = {
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "Timeout",
+    "ConnectTimeout",
+    "ReadTimeout",
+    "ConnectionError",
+}
+
+
+def _status_code(exc: Exception) -> Optional[int]:
+    """Pull an HTTP status code off an exception, if it carries one."""
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None) or getattr(exc, "status_code", None)
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Honor a server-supplied Retry-After header when present."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Retry 429s and 5xx; fail fast on auth and other 4xx errors.
+
+    Public so call sites that cannot use the decorator (e.g. streaming
+    generators) can apply the same transient/permanent split.
+    """
+    status = _status_code(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(exc).__name__ in _RETRYABLE_NAMES
+
+
+def retry(fn=None, *, max_retries: int = 3, base_ms: int = 100, on_cooldown=None):
+    """
+    Decorate a callable (sync or async) with transient-failure retries.
+
+    Delays follow base_ms * 2^attempt plus up to one second of jitter,
+    unless the server sent a Retry-After header, which takes precedence.
+
+    Args:
+        fn: The callable to wrap (also usable as @retry(...) with options)
+        max_retries: Attempts after the first failure
+        base_ms: Base backoff delay in milliseconds
+        on_cooldown: Optional callable invoked with the Retry-After value
+            (seconds) when the server mandates one, e.g. a rate bucket's
+            penalize so sibling dispatches also hold off
+
+    Returns:
+        The wrapped callable
+    """
+    def decorator(func):
+        def compute_delay(exc: Exception, attempt: int) -> float:
+            delay = _retry_after(exc)
+            if delay is not None:
+                if on_cooldown is not None:
+                    on_cooldown(delay)
+                return delay
+            return (base_ms * (2 ** attempt)) / 1000.0 + random.uniform(0, 1)
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def awrapper(*args, **kwargs):
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt >= max_retries or not is_retryable(e):
+                            raise
+                        await asyncio.sleep(compute_delay(e, attempt))
+            return awrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt >= max_retries or not is_retryable(e):
+                        raise
+                    time.sleep(compute_delay(e, attempt))
+        return wrapper
+
+    if fn is not None:
+        return decorator(fn)
+    return decorator
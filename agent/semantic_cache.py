@@ -0,0 +1,109 @@
+"""Semantic cache for agent task results.
+
+Exact-match caching never fires for paraphrases ("List top 5 AI
+languages" vs "Top five programming languages for AI"). This cache
+embeds each task with a small local model and serves the answer of the
+nearest cached neighbour when cosine similarity clears a threshold, so
+a reworded repeat costs one embedding instead of an LLM run.
+
+Requires the optional ``sentence-transformers`` and ``faiss-cpu``
+packages; importing this module without them raises ImportError.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import faiss
+from sentence_transformers import SentenceTransformer
+
+from agent.utils import json_dumps, json_loads
+
+_DEFAULT_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+
+
+class SemanticCache:
+    """Nearest-neighbour cache over normalized task embeddings."""
+
+    def __init__(
+        self,
+        embed_model: str = _DEFAULT_MODEL,
+        threshold: float = 0.92,
+        index_path: Optional[str] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed_model: Sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity counted as a hit
+            index_path: Optional path for persisting the FAISS index
+                (results are stored in a JSON sidecar next to it)
+        """
+        self.model = SentenceTransformer(embed_model)
+        self.threshold = threshold
+        self.index_path = index_path
+        self.index = faiss.IndexFlatIP(
+            self.model.get_sentence_embedding_dimension()
+        )
+        self.results: List[Dict[str, Any]] = []
+
+        if index_path and os.path.exists(index_path):
+            self._load()
+
+    def _embed(self, texts: List[str]):
+        """Embed texts as unit vectors (inner product == cosine)."""
+        return self.model.encode(list(texts), normalize_embeddings=True)
+
+    def lookup_many(
+        self, tasks: List[str]
+    ) -> Tuple[Dict[int, Dict[str, Any]], List[str]]:
+        """
+        Split tasks into cached hits and misses.
+
+        Args:
+            tasks: Task descriptions to look up
+
+        Returns:
+            (hits, misses) where hits maps a task's index in the input
+            list to its cached result and misses lists the tasks that
+            need a real run, in input order
+        """
+        if self.index.ntotal == 0:
+            return {}, list(tasks)
+
+        scores, ids = self.index.search(self._embed(tasks), 1)
+
+        hits: Dict[int, Dict[str, Any]] = {}
+        misses: List[str] = []
+        for i, task in enumerate(tasks):
+            if scores[i][0] >= self.threshold:
+                hits[i] = self.results[ids[i][0]]
+            else:
+                misses.append(task)
+        return hits, misses
+
+    def lookup(self, task: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a task, or None on miss."""
+        hits, _ = self.lookup_many([task])
+        return hits.get(0)
+
+    def insert(self, task: str, result: Dict[str, Any]) -> None:
+        """Store a task's result and persist the index if configured."""
+        self.index.add(self._embed([task]))
+        self.results.append(result)
+        if self.index_path:
+            self.save()
+
+    def save(self) -> None:
+        """Write the index and its results sidecar to disk."""
+        faiss.write_index(self.index, self.index_path)
+        with open(self.index_path + ".results.json", "w", encoding="utf-8") as f:
+            f.write(json_dumps(self.results))
+
+    def _load(self) -> None:
+        """Load a previously saved index and results sidecar."""
+        self.index = faiss.read_index(self.index_path)
+        sidecar = self.index_path + ".results.json"
+        if os.path.exists(sidecar):
+            with open(sidecar, encoding="utf-8") as f:
+                self.results = json_loads(f.read())
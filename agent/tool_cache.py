@@ -0,0 +1,91 @@
+"""Result cache for agent tools.
+
+The ReAct loop frequently re-invokes tools with identical arguments,
+both within a task and across tasks in a batch. Caching results keyed on
+(tool name, arguments) lets repeat calls skip network and filesystem I/O
+entirely.
+"""
+
+import functools
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Optional
+
+from cachetools import TTLCache
+
+
+class ToolCache:
+    """Thread-safe LRU + TTL cache for tool results."""
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 600):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            ttl: Seconds before a cached result expires
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(name: str, args: tuple, kwargs: dict, extra: Any = None) -> str:
+        """Build a stable cache key from a tool name and its arguments."""
+        payload = json.dumps(
+            {"args": args, "kwargs": sorted(kwargs.items()), "extra": extra},
+            default=str
+        )
+        digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return f"{name}:{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for key, or None on miss/expiry."""
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result under key."""
+        with self._lock:
+            self._cache[key] = value
+
+    def cached(self, extra_key: Optional[Callable[..., Any]] = None) -> Callable:
+        """
+        Decorator that memoizes a tool function in this cache.
+
+        Args:
+            extra_key: Optional callable receiving the tool's arguments
+                whose return value is folded into the cache key (e.g. a
+                file mtime so edits invalidate cached reads). If it
+                raises OSError the cache is bypassed for that call.
+
+        Returns:
+            The decorating function
+        """
+        def decorator(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if extra_key is not None:
+                    try:
+                        extra = extra_key(*args, **kwargs)
+                    except OSError:
+                        return fn(*args, **kwargs)
+                else:
+                    extra = None
+
+                key = self.make_key(fn.__name__, args, kwargs, extra)
+                hit = self.get(key)
+                if hit is not None:
+                    return hit
+
+                result = fn(*args, **kwargs)
+                # Tools report failures as "Error ..." strings; those are
+                # transient (permissions get fixed, files appear), so
+                # caching them would keep serving a stale failure for the
+                # full TTL
+                if not (isinstance(result, str) and result.startswith("Error")):
+                    self.set(key, result)
+                return result
+
+            return wrapper
+        return decorator
@@ -2,56 +2,150 @@
 
 from typing import Any
 from langchain.tools import tool
+from langchain_core.tools import StructuredTool
+import ast
+import bisect
+import functools
+import mmap
+import os
+import re
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from bs4 import BeautifulSoup
 import json
 
+from agent.http import get_async_client
+from agent.tool_cache import ToolCache
+from agent.utils import truncate_text
 
-@tool
-def web_search(query: str, max_results: int = 5) -> str:
+# Caps on tool output handed back to the agent. Everything a tool returns
+# lands in the ReAct scratchpad and is re-sent to the LLM on every later
+# iteration, so unbounded outputs make prefill cost grow quadratically.
+_MAX_TOOL_OUTPUT = 2000
+_MAX_LARGE_TOOL_OUTPUT = 8192
+
+
+# Shared session so repeated searches reuse pooled Keep-Alive connections
+# instead of paying a fresh TCP + TLS handshake per call.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
+# Caches for repeat tool invocations: a short TTL for results that can go
+# stale (searches, directory listings) and a longer one for deterministic
+# results (file reads keyed on mtime, calculations).
+_IO_CACHE = ToolCache(maxsize=1024, ttl=300)
+_RESULT_CACHE = ToolCache(maxsize=1024, ttl=600)
+
+_WORD_RE = re.compile(r'\S+')
+_NEWLINE_RE = re.compile(r'\n')
+# Runs of dots split sentences, so ellipses and trailing periods do not
+# count as extra sentences (decimal points still do, as in the baseline)
+_SENTENCE_SPLIT_RE = re.compile(r'\.+')
+_LONG_LINE_RE = re.compile(r'[^\n]{101,}')
+_ISSUE_RE = re.compile(r'TODO|FIXME')
+
+
+def _format_search_results(query: str, results: dict, max_results: int) -> str:
+    """Format a DuckDuckGo JSON response into a readable result string."""
+    abstracts = results.get('AbstractText', '')
+    related = results.get('RelatedTopics', [])[:max_results]
+
+    parts = [f"Search Results for '{query}':\n\n"]
+    if abstracts:
+        parts.append(f"Summary: {abstracts}\n\n")
+
+    if related:
+        parts.append("Related Information:\n")
+        for item in related:
+            if 'Text' in item:
+                parts.append(f"- {item['Text']}\n")
+
+    output = "".join(parts)
+    if not output.strip():
+        return "No results found."
+    return truncate_text(output, max_length=_MAX_LARGE_TOOL_OUTPUT)
+
+
+def _search_cache_key(query: str, max_results: int) -> str:
+    """One key shape for both search paths, so a sync hit serves async
+    callers and vice versa."""
+    return ToolCache.make_key('web_search', (query,), {'max_results': max_results})
+
+
+def _web_search_sync(query: str, max_results: int = 5) -> str:
     """
     Search the web for information about a given query.
-    
+
     Args:
         query: The search query string
         max_results: Maximum number of results to return
-        
+
     Returns:
         A formatted string with search results
     """
+    key = _search_cache_key(query, max_results)
+    hit = _IO_CACHE.get(key)
+    if hit is not None:
+        return hit
+
     try:
         # Using DuckDuckGo search (no API key needed)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
         search_url = f"https://api.duckduckgo.com/?q={query}&format=json&no_html=1"
-        response = requests.get(search_url, headers=headers, timeout=10)
-        
+        response = _SESSION.get(search_url, timeout=(3, 10))
+
+        if response.status_code == 200:
+            result = _format_search_results(query, response.json(), max_results)
+        else:
+            return f"Search failed with status code {response.status_code}"
+
+    except Exception as e:
+        return f"Error during search: {str(e)}"
+
+    _IO_CACHE.set(key, result)
+    return result
+
+
+async def _web_search_async(query: str, max_results: int = 5) -> str:
+    """Async variant of web_search sharing the pooled HTTP/2 client."""
+    key = _search_cache_key(query, max_results)
+    hit = _IO_CACHE.get(key)
+    if hit is not None:
+        return hit
+
+    try:
+        search_url = f"https://api.duckduckgo.com/?q={query}&format=json&no_html=1"
+        response = await get_async_client().get(search_url)
+
         if response.status_code == 200:
-            results = response.json()
-            
-            # Extract abstract results
-            abstracts = results.get('AbstractText', '')
-            related = results.get('RelatedTopics', [])[:max_results]
-            
-            output = f"Search Results for '{query}':\n\n"
-            if abstracts:
-                output += f"Summary: {abstracts}\n\n"
-            
-            if related:
-                output += "Related Information:\n"
-                for item in related:
-                    if 'Text' in item:
-                        output += f"- {item['Text']}\n"
-            
-            return output if output.strip() else "No results found."
+            result = _format_search_results(query, response.json(), max_results)
         else:
             return f"Search failed with status code {response.status_code}"
-            
+
     except Exception as e:
         return f"Error during search: {str(e)}"
 
+    _IO_CACHE.set(key, result)
+    return result
+
+
+# Registered with both sync and async implementations so that
+# AgentExecutor.ainvoke drives the pooled AsyncClient natively instead of
+# pushing the blocking call onto a thread.
+web_search = StructuredTool.from_function(
+    func=_web_search_sync,
+    coroutine=_web_search_async,
+    name="web_search"
+)
+
 
 @tool
 def analyze_text(text: str, analysis_type: str = "summary") -> str:
@@ -67,43 +161,68 @@ def analyze_text(text: str, analysis_type: str = "summary") -> str:
     """
     if not text or len(text.strip()) == 0:
         return "Error: Empty text provided"
-    
-    # Simple text analysis (in production, use NLP library)
-    lines = text.split('\n')
-    word_count = len(text.split())
-    sentence_count = len([s for s in text.split('.') if s.strip()])
-    
-    result = f"Text Analysis ({analysis_type}):\n"
-    result += f"- Words: {word_count}\n"
-    result += f"- Sentences: {sentence_count}\n"
-    result += f"- Lines: {len(lines)}\n"
-    
+
+    # Simple text analysis (in production, use NLP library).
+    # Counts use a single regex pass / str.count instead of materializing
+    # split lists, so large inputs are scanned without extra allocations.
+    word_count = len(_WORD_RE.findall(text))
+    sentence_count = sum(
+        1 for segment in _SENTENCE_SPLIT_RE.split(text) if segment.strip()
+    )
+    line_count = text.count('\n') + 1
+
+    parts = [
+        f"Text Analysis ({analysis_type}):\n",
+        f"- Words: {word_count}\n",
+        f"- Sentences: {sentence_count}\n",
+        f"- Lines: {line_count}\n",
+    ]
+
     if analysis_type == "keypoints":
-        # Extract first sentence from each paragraph
+        # Report the total paragraph count but extract first sentences
+        # only from the first few paragraphs
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-        result += f"\nKey Points ({len(paragraphs)} paragraphs):\n"
+        parts.append(f"\nKey Points ({len(paragraphs)} paragraphs):\n")
         for i, para in enumerate(paragraphs[:5], 1):
-            first_sentence = para.split('.')[0] + '.'
-            result += f"{i}. {first_sentence}\n"
-    
-    return result
+            first_sentence = para.split('.', 1)[0] + '.'
+            parts.append(f"{i}. {first_sentence}\n")
+
+    return truncate_text("".join(parts), max_length=_MAX_TOOL_OUTPUT)
+
+
+# Cap on bytes returned per read; the LLM truncates long context anyway
+_MAX_READ_BYTES = 256 * 1024
 
 
 @tool
+@_RESULT_CACHE.cached(extra_key=lambda file_path: os.stat(file_path).st_mtime_ns)
 def read_file(file_path: str) -> str:
     """
     Read the contents of a file.
-    
+
     Args:
         file_path: Path to the file to read
-        
+
     Returns:
-        File contents or error message
+        File contents (up to a 256 KB prefix) or error message
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return f"File Contents ({file_path}):\n{content}"
+        with open(file_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size > 4 * _MAX_READ_BYTES:
+                # Very large file: map only the prefix instead of paging
+                # the whole thing through a read buffer
+                mapped = mmap.mmap(f.fileno(), _MAX_READ_BYTES, access=mmap.ACCESS_READ)
+                data = bytes(mapped)
+                mapped.close()
+            else:
+                data = f.read(_MAX_READ_BYTES)
+
+        content = data.decode('utf-8', errors='replace')
+        if file_size > len(data):
+            content += f"\n... [truncated, file is {file_size} bytes]"
+        return truncate_text(f"File Contents ({file_path}):\n{content}",
+                             max_length=_MAX_LARGE_TOOL_OUTPUT)
     except FileNotFoundError:
         return f"Error: File not found - {file_path}"
     except Exception as e:
@@ -111,6 +230,7 @@ def read_file(file_path: str) -> str:
 
 
 @tool
+@_IO_CACHE.cached()
 def list_files(directory: str = ".") -> str:
     """
     List files in a directory.
@@ -121,47 +241,74 @@ def list_files(directory: str = ".") -> str:
     Returns:
         List of files and directories
     """
-    import os
-    
     try:
-        items = os.listdir(directory)
-        output = f"Files in {directory}:\n"
-        
-        for item in sorted(items)[:20]:  # Limit to 20 items
-            full_path = os.path.join(directory, item)
-            if os.path.isdir(full_path):
-                output += f"📁 {item}/\n"
+        # scandir caches the entry type from the directory read, so no
+        # extra stat syscall is paid per entry (unlike listdir + isdir)
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+
+        parts = [f"Files in {directory}:\n"]
+
+        for entry in entries[:20]:  # Limit to 20 items
+            if entry.is_dir(follow_symlinks=False):
+                parts.append(f"📁 {entry.name}/\n")
             else:
-                output += f"📄 {item}\n"
-        
-        if len(items) > 20:
-            output += f"... and {len(items) - 20} more items"
-        
-        return output
+                parts.append(f"📄 {entry.name}\n")
+
+        if len(entries) > 20:
+            parts.append(f"... and {len(entries) - 20} more items")
+
+        return truncate_text("".join(parts), max_length=_MAX_TOOL_OUTPUT)
     except Exception as e:
         return f"Error listing directory: {str(e)}"
 
 
+# Only allow safe mathematical operations
+_CALC_NAMES = {
+    'abs': abs, 'round': round, 'sum': sum,
+    'min': min, 'max': max,
+    'pow': pow
+}
+
+# AST node types permitted in calculator expressions
+_CALC_NODES = {
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Pow, ast.Mod,
+    ast.UAdd, ast.USub,
+    ast.Call, ast.Name, ast.Load, ast.Tuple, ast.List
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str):
+    """Validate and compile an expression, caching the resulting code object."""
+    tree = ast.parse(expression, mode='eval')
+    for node in ast.walk(tree):
+        if type(node) not in _CALC_NODES:
+            raise ValueError(f"Disallowed syntax: {type(node).__name__}")
+    return compile(tree, '<calc>', 'eval')
+
+
 @tool
+@_RESULT_CACHE.cached()
 def calculate(expression: str) -> str:
     """
     Evaluate a mathematical expression.
-    
+
     Args:
         expression: Mathematical expression to evaluate
-        
+
     Returns:
         The result of the calculation
     """
     try:
-        # Only allow safe mathematical operations
-        allowed_names = {
-            'abs': abs, 'round': round, 'sum': sum,
-            'min': min, 'max': max,
-            'pow': pow
-        }
-        result = eval(expression, {"__builtins__": {}}, allowed_names)
-        return f"Result of '{expression}': {result}"
+        # Expressions are AST-checked against a whitelist and compiled once,
+        # so repeated evaluations skip the parse/compile step (and nothing
+        # outside basic arithmetic can execute).
+        code = _compile_expression(expression)
+        result = eval(code, {"__builtins__": {}}, _CALC_NAMES)
+        return truncate_text(f"Result of '{expression}': {result}",
+                             max_length=_MAX_TOOL_OUTPUT)
     except Exception as e:
         return f"Error evaluating expression: {str(e)}"
 
@@ -178,36 +325,49 @@ def code_review(code: str, language: str = "python") -> str:
     Returns:
         Code review feedback
     """
-    feedback = f"Code Review ({language}):\n\n"
-    
-    lines = code.split('\n')
-    feedback += f"Lines of code: {len(lines)}\n"
-    
-    # Simple heuristic checks
+    feedback = [f"Code Review ({language}):\n\n"]
+
+    line_count = code.count('\n') + 1
+    feedback.append(f"Lines of code: {line_count}\n")
+
+    # Simple heuristic checks, run as regex scans over the raw text
+    # instead of per-line Python checks. Line numbers come from a binary
+    # search over precomputed newline offsets, so the code is never split.
+    newline_offsets = [m.start() for m in _NEWLINE_RE.finditer(code)]
+
+    def line_number(pos: int) -> int:
+        return bisect.bisect_right(newline_offsets, pos) + 1
+
+    def line_text(lineno: int) -> str:
+        start = newline_offsets[lineno - 2] + 1 if lineno > 1 else 0
+        end = newline_offsets[lineno - 1] if lineno <= len(newline_offsets) else len(code)
+        return code[start:end].strip()
+
     issues = []
-    
-    # Check for common issues
-    for i, line in enumerate(lines, 1):
-        if len(line) > 100:
-            issues.append(f"Line {i}: Long line detected ({len(line)} chars)")
-        if line.strip().startswith('#') and len(line.strip()) > 2:
-            pass  # Comment, usually ok
-        if 'TODO' in line or 'FIXME' in line:
-            issues.append(f"Line {i}: TODO/FIXME found - {line.strip()}")
-    
+
+    for match in _LONG_LINE_RE.finditer(code):
+        lineno = line_number(match.start())
+        issues.append((lineno, f"Line {lineno}: Long line detected ({len(match.group())} chars)"))
+
+    for match in _ISSUE_RE.finditer(code):
+        lineno = line_number(match.start())
+        issues.append((lineno, f"Line {lineno}: TODO/FIXME found - {line_text(lineno)}"))
+
+    issues = [message for _, message in sorted(issues)]
+
     if issues:
-        feedback += "\nPotential Issues:\n"
+        feedback.append("\nPotential Issues:\n")
         for issue in issues[:5]:
-            feedback += f"- {issue}\n"
+            feedback.append(f"- {issue}\n")
     else:
-        feedback += "\nNo major issues detected.\n"
-    
-    feedback += "\nSuggestions:\n"
-    feedback += "- Add type hints for better clarity\n"
-    feedback += "- Include docstrings for functions\n"
-    feedback += "- Add error handling where needed\n"
-    
-    return feedback
+        feedback.append("\nNo major issues detected.\n")
+
+    feedback.append("\nSuggestions:\n")
+    feedback.append("- Add type hints for better clarity\n")
+    feedback.append("- Include docstrings for functions\n")
+    feedback.append("- Add error handling where needed\n")
+
+    return truncate_text("".join(feedback), max_length=_MAX_TOOL_OUTPUT)
 
 
 # Tool registry for easy access
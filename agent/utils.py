@@ -1,9 +1,35 @@
 """Utility functions for the Research Agent."""
 
+import collections
 import json
+import sys
 import time
 from typing import Any, Dict, List
 
+import config
+
+# Prefer orjson (C parser, SIMD UTF-8 validation) for JSON at message
+# boundaries; fall back to the stdlib when it is not installed.
+try:
+    import orjson
+
+    def json_loads(data: Any) -> Any:
+        """Parse JSON from a str or bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    def json_loads(data: Any) -> Any:
+        """Parse JSON from a str or bytes."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return json.dumps(obj)
+
 
 def format_tool_output(tool_name: str, output: str) -> str:
     """Format tool output for agent consumption."""
@@ -13,8 +39,8 @@ def format_tool_output(tool_name: str, output: str) -> str:
 def parse_json_output(text: str) -> Dict[str, Any]:
     """Attempt to parse JSON from text."""
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return json_loads(text)
+    except ValueError:
         return {}
 
 
@@ -32,52 +58,73 @@ def format_markdown(title: str, content: str, level: int = 2) -> str:
 
 
 class ExecutionTracker:
-    """Track agent execution metrics."""
-    
+    """Track agent execution metrics.
+
+    Aggregates are maintained incrementally (a Counter of calls per tool
+    and a running duration total) so memory stays O(1) however long the
+    agent runs and get_metrics never rescans a call history.
+    """
+
+    __slots__ = ('start_time', 'iterations', '_tool_counts', '_total_tool_time')
+
     def __init__(self):
-        self.start_time = time.time()
-        self.tool_calls = []
+        self.start_time = time.perf_counter()
         self.iterations = 0
-    
+        self._tool_counts = collections.Counter()
+        self._total_tool_time = 0.0
+
     def log_tool_call(self, tool_name: str, duration: float):
         """Log a tool call."""
-        self.tool_calls.append({
-            "tool": tool_name,
-            "duration": duration,
-            "timestamp": time.time()
-        })
-    
+        self._tool_counts[tool_name] += 1
+        self._total_tool_time += duration
+
     def get_metrics(self) -> Dict[str, Any]:
         """Get execution metrics."""
-        total_time = time.time() - self.start_time
+        total_time = time.perf_counter() - self.start_time
+        call_count = sum(self._tool_counts.values())
         return {
             "total_time": round(total_time, 2),
             "iterations": self.iterations,
-            "tool_calls": len(self.tool_calls),
-            "tools_used": list(set(call["tool"] for call in self.tool_calls)),
-            "average_tool_time": round(sum(c["duration"] for c in self.tool_calls) / len(self.tool_calls), 2) if self.tool_calls else 0
+            "tool_calls": call_count,
+            "tools_used": list(self._tool_counts),
+            "average_tool_time": round(self._total_tool_time / call_count, 2) if call_count else 0
         }
 
 
+# Progress echoes (thinking/action) are skipped entirely when verbose
+# output is disabled; sections and results always print since they carry
+# user-facing output. Each helper emits one stdout write rather than a
+# line-buffered print per line. The flag starts from the environment and
+# follows each agent's verbose setting via set_verbose.
+_VERBOSE = config.VERBOSE
+
+
+def set_verbose(enabled: bool):
+    """Enable or disable progress echoes at runtime."""
+    global _VERBOSE
+    _VERBOSE = enabled
+
+
 def print_section(title: str, content: str = ""):
     """Print a formatted section."""
-    print("\n" + "="*60)
-    print(f"  {title}")
-    print("="*60)
+    parts = ["\n" + "=" * 60, f"  {title}", "=" * 60]
     if content:
-        print(content)
+        parts.append(content)
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def print_thinking(message: str):
     """Print agent thinking process."""
-    print(f"\n🤔 {message}")
+    if _VERBOSE:
+        sys.stdout.write(f"\n🤔 {message}\n")
 
 
 def print_action(message: str):
     """Print agent action."""
-    print(f"\n⚡ {message}")
+    if _VERBOSE:
+        sys.stdout.write(f"\n⚡ {message}\n")
 
 
 def print_result(message: str):
     """Print result."""
-    print(f"\n✅ {message}")
+    sys.stdout.write(f"\n✅ {message}\n")
@@ -1,29 +1,103 @@
 """Configuration for the Research Agent."""
 
+import functools
 import os
+from dataclasses import dataclass
+from typing import Optional
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# LLM Configuration
-LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")  # "openai" or "gemini"
-LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4-turbo-preview")
-LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.7"))
-LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "4096"))
 
-# API Keys
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# No slots=True: that dataclass option needs Python 3.10 and the
+# package supports 3.9; a single frozen instance gains nothing from it
+@dataclass(frozen=True)
+class Config:
+    """Immutable snapshot of environment-driven settings.
+
+    Config.load() reads the environment exactly once per process; every
+    later call returns the same cached instance.
+    """
+
+    # LLM Configuration
+    llm_provider: str = "openai"  # "openai" or "gemini"
+    llm_model: str = "gpt-4-turbo-preview"
+    llm_temperature: float = 0.7
+    llm_max_tokens: int = 4096
+
+    # API Keys
+    openai_api_key: Optional[str] = None
+    gemini_api_key: Optional[str] = None
+
+    # Agent Configuration
+    max_iterations: int = 10
+    timeout_seconds: int = 300
+    verbose: bool = True
+    max_workers: int = 8
+    max_concurrency: int = 8
+    max_batch_tasks: int = 8
+
+    # Provider rate limits (tokens and requests per minute)
+    rate_limit_tpm: int = 30000
+    rate_limit_rpm: int = 500
+
+    # LLM response cache (only safe at low temperature, so off by default)
+    enable_llm_cache: bool = False
+
+    # Tool Configuration
+    enable_web_search: bool = True
+    enable_file_access: bool = True
+    enable_code_analysis: bool = True
+
+    # Directories
+    workspace_dir: str = os.path.dirname(os.path.abspath(__file__))
+
+    @classmethod
+    @functools.cache
+    def load(cls) -> "Config":
+        """Build the configuration from environment variables (cached)."""
+        return cls(
+            llm_provider=os.getenv("LLM_PROVIDER", "openai"),
+            llm_model=os.getenv("LLM_MODEL", "gpt-4-turbo-preview"),
+            llm_temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
+            llm_max_tokens=int(os.getenv("LLM_MAX_TOKENS", "4096")),
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            gemini_api_key=os.getenv("GEMINI_API_KEY"),
+            max_iterations=int(os.getenv("MAX_ITERATIONS", "10")),
+            timeout_seconds=int(os.getenv("TIMEOUT_SECONDS", "300")),
+            verbose=os.getenv("VERBOSE", "True").lower() == "true",
+            max_workers=int(os.getenv("MAX_WORKERS", "8")),
+            max_concurrency=int(os.getenv("MAX_CONCURRENCY", "8")),
+            max_batch_tasks=int(os.getenv("MAX_BATCH_TASKS", "8")),
+            rate_limit_tpm=int(os.getenv("RATE_LIMIT_TPM", "30000")),
+            rate_limit_rpm=int(os.getenv("RATE_LIMIT_RPM", "500")),
+            enable_llm_cache=os.getenv("ENABLE_LLM_CACHE", "False").lower() == "true",
+            enable_web_search=os.getenv("ENABLE_WEB_SEARCH", "True").lower() == "true",
+            enable_file_access=os.getenv("ENABLE_FILE_ACCESS", "True").lower() == "true",
+            enable_code_analysis=os.getenv("ENABLE_CODE_ANALYSIS", "True").lower() == "true",
+        )
 
-# Agent Configuration
-MAX_ITERATIONS = int(os.getenv("MAX_ITERATIONS", "10"))
-TIMEOUT_SECONDS = int(os.getenv("TIMEOUT_SECONDS", "300"))
-VERBOSE = os.getenv("VERBOSE", "True").lower() == "true"
 
-# Tool Configuration
-ENABLE_WEB_SEARCH = os.getenv("ENABLE_WEB_SEARCH", "True").lower() == "true"
-ENABLE_FILE_ACCESS = os.getenv("ENABLE_FILE_ACCESS", "True").lower() == "true"
-ENABLE_CODE_ANALYSIS = os.getenv("ENABLE_CODE_ANALYSIS", "True").lower() == "true"
+CONFIG = Config.load()
 
-# Directories
-WORKSPACE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Module-level aliases kept for existing call sites
+LLM_PROVIDER = CONFIG.llm_provider
+LLM_MODEL = CONFIG.llm_model
+LLM_TEMPERATURE = CONFIG.llm_temperature
+LLM_MAX_TOKENS = CONFIG.llm_max_tokens
+OPENAI_API_KEY = CONFIG.openai_api_key
+GEMINI_API_KEY = CONFIG.gemini_api_key
+MAX_ITERATIONS = CONFIG.max_iterations
+TIMEOUT_SECONDS = CONFIG.timeout_seconds
+VERBOSE = CONFIG.verbose
+MAX_WORKERS = CONFIG.max_workers
+MAX_CONCURRENCY = CONFIG.max_concurrency
+MAX_BATCH_TASKS = CONFIG.max_batch_tasks
+RATE_LIMIT_TPM = CONFIG.rate_limit_tpm
+RATE_LIMIT_RPM = CONFIG.rate_limit_rpm
+ENABLE_LLM_CACHE = CONFIG.enable_llm_cache
+ENABLE_WEB_SEARCH = CONFIG.enable_web_search
+ENABLE_FILE_ACCESS = CONFIG.enable_file_access
+ENABLE_CODE_ANALYSIS = CONFIG.enable_code_analysis
+WORKSPACE_DIR = CONFIG.workspace_dir
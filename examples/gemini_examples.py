@@ -84,41 +84,28 @@ Focus on:
 
 def compare_providers():
     """Compare Gemini and OpenAI on the same task."""
-    
+
     task = "Explain what makes a good software architecture in 3 bullet points"
-    
+
     print_section("COMPARING PROVIDERS")
     print(f"Task: {task}\n")
-    
-    # Try Gemini
-    print("=" * 60)
-    print("GEMINI RESPONSE")
-    print("=" * 60)
-    try:
-        gemini_agent = create_agent(provider="gemini", verbose=False)
-        result = gemini_agent.run(task)
-        if result['success']:
-            print(result['output'][:500])
-            print(f"\nExecution time: {result['metrics']['execution_time']}s")
-        else:
-            print("Failed - no Gemini API key?")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    # Try OpenAI
-    print("\n" + "=" * 60)
-    print("OPENAI RESPONSE")
-    print("=" * 60)
-    try:
-        openai_agent = create_agent(provider="openai", verbose=False)
-        result = openai_agent.run(task)
+
+    # One agent, one tool set and prompt; only the LLM differs per
+    # provider, and both runs overlap instead of executing back to back
+    agent = create_agent(provider="gemini", verbose=False)
+    results = agent.run_on_many_providers(task, providers=["gemini", "openai"])
+
+    for provider in ["gemini", "openai"]:
+        print("=" * 60)
+        print(f"{provider.upper()} RESPONSE")
+        print("=" * 60)
+        result = results[provider]
         if result['success']:
             print(result['output'][:500])
             print(f"\nExecution time: {result['metrics']['execution_time']}s")
         else:
-            print("Failed - no OpenAI API key?")
-    except Exception as e:
-        print(f"Error: {e}")
+            print(f"Failed - no {provider} API key?")
+        print()
 
 
 if __name__ == "__main__":
@@ -4,13 +4,11 @@ This example demonstrates the agent researching a topic and providing
 comprehensive findings.
 """
 
-import sys
 import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import sys
 
 from agent.core import create_agent
+from agent.result_cache import CachedAgent
 from agent.utils import print_section, print_result
 
 
@@ -37,16 +35,16 @@ def research_task_example():
         print(result['output'])
         
         print_section("EXECUTION METRICS")
-        for key, value in result['metrics'].items():
-            print(f"  {key}: {value}")
+        # One write for the whole block instead of a flush per metric line
+        sys.stdout.write('\n'.join(f"  {k}: {v}" for k, v in result['metrics'].items()) + '\n')
     else:
         print_section("ERROR", result.get('error', 'Unknown error'))
 
 
 def batch_research_example():
     """Run multiple research tasks."""
-    
-    agent = create_agent(verbose=False)
+
+    agent = CachedAgent(create_agent(verbose=False))
     
     tasks = [
         "What are the main differences between generative AI and traditional machine learning?",
@@ -56,8 +54,38 @@ def batch_research_example():
     
     print_section("BATCH RESEARCH TASKS")
     print(f"Running {len(tasks)} research tasks...\n")
-    
-    results = agent.run_batch(tasks)
+
+    # Each distinct task is run once; duplicates reuse that result.
+    # dict.fromkeys keeps first-seen order, so output order is unchanged.
+    unique_tasks = list(dict.fromkeys(tasks))
+
+    # Serve paraphrase-level repeats from the semantic cache when its
+    # optional dependencies (sentence-transformers + faiss) are
+    # installed. The index persists next to the run cache so reworded
+    # repeats short-circuit across invocations, not just within one.
+    try:
+        from agent.semantic_cache import SemanticCache
+        index_path = os.path.expanduser('~/.cache/research_agent/semantic.index')
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        cache = SemanticCache(index_path=index_path)
+    except ImportError:
+        cache = None
+
+    if cache is not None:
+        hits, misses = cache.lookup_many(unique_tasks)
+        # The remaining tasks are pure-knowledge questions, so pack them
+        # into one LLM call instead of paying a round trip per task
+        fresh = agent.run_multi(misses) if misses else []
+        for task, result in zip(misses, fresh):
+            if result['success']:
+                cache.insert(task, result)
+        fresh_iter = iter(fresh)
+        unique_results = [hits.get(i) or next(fresh_iter) for i in range(len(unique_tasks))]
+    else:
+        unique_results = agent.run_multi(unique_tasks)
+
+    result_by_task = dict(zip(unique_tasks, unique_results))
+    results = [result_by_task[task] for task in tasks]
     
     for i, (task, result) in enumerate(zip(tasks, results), 1):
         print_section(f"Task {i}: {task[:50]}...")
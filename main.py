@@ -9,22 +9,85 @@ Usage:
     python main.py                                  # Interactive mode
 """
 
+import argparse
+import functools
 import sys
 import os
-from agent.core import create_agent
-from agent.utils import print_section, print_result
-import config
+import time
+
+# The agent package (and, through it, the LangChain/OpenAI/Gemini SDKs)
+# and config are imported lazily inside the functions that need them, so
+# --help and the missing-API-key paths return without paying hundreds of
+# milliseconds of SDK import time.
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config():
+    """Import config on first use (it reads .env at import time)."""
+    import config
+    return config
+
+
+@functools.lru_cache(maxsize=None)
+def _env(key):
+    """Cached environment lookup for values that never change mid-run."""
+    return os.getenv(key)
+
+
+# Hot-loop membership tests use frozensets built once at import instead
+# of list literals rebuilt per check
+_QUIT_WORDS = frozenset({'quit', 'exit', 'q'})
+_HELP_FLAGS = frozenset({'--help', '-h', 'help'})
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """Parser that raises on bad arguments instead of printing usage
+    to stderr and exiting."""
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+# Built once at import; --help is handled separately in main() so the
+# custom help text stays as it was. Only --provider is declared — task
+# words come back via parse_known_args, so tasks may contain
+# leading-dash tokens like "compute -5 + 3".
+_PARSER = _ArgumentParser(add_help=False)
+_PARSER.add_argument('--provider', choices=('gemini', 'openai'), default=None)
 
 
 def interactive_mode(agent):
     """Run the agent in interactive mode."""
+    from agent.utils import print_section, print_result
+
+    # Line editing plus persistent history across sessions; pyreadline3
+    # covers Windows, and plain input() still works without either
+    try:
+        import readline
+    except ImportError:
+        try:
+            import pyreadline3 as readline
+        except ImportError:
+            readline = None
+
+    if readline is not None:
+        import atexit
+        histfile = os.path.expanduser('~/.research_agent_history')
+        try:
+            readline.read_history_file(histfile)
+        except (FileNotFoundError, OSError):
+            pass
+        readline.set_history_length(1000)
+        atexit.register(readline.write_history_file, histfile)
+
     print_section("INTERACTIVE MODE", "Type 'quit' or 'exit' to stop")
     
     while True:
         try:
             task = input("\n🎯 Enter your task: ").strip()
             
-            if task.lower() in ['quit', 'exit', 'q']:
+            # Length guard first, so long tasks (the common case) never
+            # pay a full-string lowercase just to rule out quit words
+            if len(task) <= 4 and task.lower() in _QUIT_WORDS:
                 print_result("Goodbye!")
                 break
             
@@ -33,13 +96,13 @@ def interactive_mode(agent):
                 continue
             
             print("\n⏳ Processing...")
-            result = agent.run(task)
-            
-            if result['success']:
-                print_section("RESULT")
-                print(result['output'])
-            else:
-                print(f"❌ Error: {result.get('error', 'Unknown error')}")
+            print_section("RESULT")
+            # Stream output as it arrives; errors fall through to the
+            # handler below like any other exception
+            for token in agent.run_stream(task):
+                sys.stdout.write(token)
+                sys.stdout.flush()
+            print()
         
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted. Goodbye!")
@@ -50,16 +113,46 @@ def interactive_mode(agent):
 
 def command_line_mode(provider, task):
     """Run the agent with a single task."""
-    agent = create_agent(provider=provider, verbose=True)
+    from agent.core import create_agent
+    from agent.result_cache import CachedAgent
+    from agent.utils import print_section
+
+    # Deterministic runs (temperature 0) of an identical task are served
+    # from the on-disk cache instead of a fresh LLM round trip
+    agent = CachedAgent(create_agent(provider=provider, verbose=True))
+
+    if agent.cache_key(task) is None:
+        # Nothing cacheable to consult, so stream tokens as they arrive
+        # and the first output shows up at first-chunk latency
+        print_section("RESULT")
+        start_time = time.time()
+        try:
+            for token in agent.run_stream(task):
+                sys.stdout.write(token)
+                sys.stdout.flush()
+        except Exception as e:
+            print(f"\n❌ Error: {str(e)}")
+            return 1
+        print()
+
+        print_section("METRICS")
+        metrics = {
+            "execution_time": round(time.time() - start_time, 2),
+            "provider": agent.provider,
+            "model": agent.model,
+        }
+        sys.stdout.write('\n'.join(f"  {k}: {v}" for k, v in metrics.items()) + '\n')
+        return 0
+
     result = agent.run(task)
-    
+
     if result['success']:
         print_section("RESULT")
         print(result['output'])
         
         print_section("METRICS")
-        for key, value in result['metrics'].items():
-            print(f"  {key}: {value}")
+        # One write for the whole block instead of a flush per metric line
+        sys.stdout.write('\n'.join(f"  {k}: {v}" for k, v in result['metrics'].items()) + '\n')
         return 0
     else:
         print(f"❌ Error: {result.get('error', 'Unknown error')}")
@@ -105,29 +198,28 @@ For more information, see QUICKSTART.md or README.md
 
 def main():
     """Main entry point."""
-    
-    # Parse command line arguments
-    provider = config.LLM_PROVIDER
-    task = None
-    
-    # Check for help flag
-    if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h', 'help']:
+
+    # Check for help flag before importing anything heavy
+    if len(sys.argv) > 1 and sys.argv[1] in _HELP_FLAGS:
         show_help()
         return 0
-    
-    # Parse --provider flag
-    if len(sys.argv) > 1 and sys.argv[1] == '--provider':
-        if len(sys.argv) < 3:
-            print("Error: --provider requires an argument (gemini or openai)")
-            return 1
-        provider = sys.argv[2]
-        if len(sys.argv) > 3:
-            task = ' '.join(sys.argv[3:])
-    elif len(sys.argv) > 1:
-        task = ' '.join(sys.argv[1:])
-    
+
+    # Parse command line arguments
+    try:
+        args, task_words = _PARSER.parse_known_args()
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    # Load config before the key checks even when --provider is given:
+    # importing config runs load_dotenv(), which is what puts .env keys
+    # into the environment in the first place
+    cfg = _load_config()
+    provider = args.provider or cfg.LLM_PROVIDER
+    task = ' '.join(task_words) or None
+
     # Check API keys
-    if provider == "gemini" and not os.getenv('GEMINI_API_KEY'):
+    if provider == "gemini" and not _env('GEMINI_API_KEY'):
         print("""
 ❌ Gemini API key not found!
 
@@ -141,7 +233,7 @@ Get your free API key at: https://ai.google.dev/
 """)
         return 1
     
-    if provider == "openai" and not os.getenv('OPENAI_API_KEY'):
+    if provider == "openai" and not _env('OPENAI_API_KEY'):
         print("""
 ❌ OpenAI API key not found!
 
@@ -161,6 +253,9 @@ Get your API key at: https://platform.openai.com/account/api-keys
     
     # Interactive mode
     try:
+        from agent.core import create_agent
+        from agent.utils import print_section
+
         agent = create_agent(provider=provider, verbose=False)
         status = agent.get_status()
         print_section("RESEARCH AGENT", f"Provider: {status['provider']}\nModel: {status['model']}")